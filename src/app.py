@@ -25,6 +25,13 @@ app = FastAPI(title="Mergington High School API",
 current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent, "static")), name="static")
 
+# Response messages
+SIGNUP_MSG = "Signed up {email} for {activity}"
+UNREGISTER_MSG = "Unregistered {email} from {activity}"
+ACTIVITY_NOT_FOUND = "Activity not found"
+ALREADY_SIGNED_UP = "Student already signed up for this activity"
+NOT_SIGNED_UP = "Student not signed up for this activity"
+
 # In-memory activity database
 activities = {
     "Chess Club": {
@@ -99,27 +106,27 @@ def signup_for_activity(activity_name: str, email: str):
     """Sign up a student for an activity"""
     # Validate activity exists
     if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        raise HTTPException(status_code=404, detail=ACTIVITY_NOT_FOUND)
 
     # Get the specific activity
     activity = activities[activity_name]
     # Validate student is not already signed up
     if email in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student already signed up for this activity")
+        raise HTTPException(status_code=400, detail=ALREADY_SIGNED_UP)
     # Add student
     activity["participants"].append(email)
-    return {"message": f"Signed up {email} for {activity_name}"}
+    return {"message": SIGNUP_MSG.format(email=email, activity=activity_name)}
 
 
 @app.post("/activities/{activity_name}/unregister")
 def unregister_from_activity(activity_name: str, email: str):
     """Unregister a student from an activity"""
     if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        raise HTTPException(status_code=404, detail=ACTIVITY_NOT_FOUND)
 
     activity = activities[activity_name]
     if email not in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student not signed up for this activity")
+        raise HTTPException(status_code=400, detail=NOT_SIGNED_UP)
 
     activity["participants"].remove(email)
-    return {"message": f"Unregistered {email} from {activity_name}"}
+    return {"message": UNREGISTER_MSG.format(email=email, activity=activity_name)}
@@ -2,177 +2,213 @@
 Tests for the High School Management System API
 """
 
+import copy
 import pytest
 from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add the src directory to the path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import (
+    app,
+    activities as _state,
+    SIGNUP_MSG,
+    UNREGISTER_MSG,
+    ACTIVITY_NOT_FOUND,
+    ALREADY_SIGNED_UP,
+    NOT_SIGNED_UP,
+)
 
-from app import app
 
-client = TestClient(app)
+@pytest.fixture(scope="session")
+def client():
+    """Shared TestClient that runs the app lifespan once for the session"""
+    with TestClient(app) as c:
+        yield c
 
 
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original activities
-    from app import activities
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball team for intramural and tournament play",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Develop tennis skills and compete in friendly matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:00 PM",
-            "max_participants": 10,
-            "participants": ["sarah@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Act in theatrical productions and develop stage presence",
-            "schedule": "Wednesdays and Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["lucas@mergington.edu", "ava@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore painting, drawing, and mixed media techniques",
-            "schedule": "Mondays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 18,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Robotics Club": {
-            "description": "Build and program robots for competitions and demonstrations",
-            "schedule": "Tuesdays and Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["noah@mergington.edu", "mia@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop argumentation and public speaking skills",
-            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 12,
-            "participants": ["ethan@mergington.edu"]
-        }
+# Canonical initial state; reset_activities restores the touched participants
+# lists from it, activities_response deep-copies it once
+_ORIGINAL_ACTIVITIES = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    },
+    "Basketball Team": {
+        "description": "Competitive basketball team for intramural and tournament play",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ["james@mergington.edu"]
+    },
+    "Tennis Club": {
+        "description": "Develop tennis skills and compete in friendly matches",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:00 PM",
+        "max_participants": 10,
+        "participants": ["sarah@mergington.edu"]
+    },
+    "Drama Club": {
+        "description": "Act in theatrical productions and develop stage presence",
+        "schedule": "Wednesdays and Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 25,
+        "participants": ["lucas@mergington.edu", "ava@mergington.edu"]
+    },
+    "Art Studio": {
+        "description": "Explore painting, drawing, and mixed media techniques",
+        "schedule": "Mondays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 18,
+        "participants": ["isabella@mergington.edu"]
+    },
+    "Robotics Club": {
+        "description": "Build and program robots for competitions and demonstrations",
+        "schedule": "Tuesdays and Fridays, 4:00 PM - 5:30 PM",
+        "max_participants": 16,
+        "participants": ["noah@mergington.edu", "mia@mergington.edu"]
+    },
+    "Debate Team": {
+        "description": "Develop argumentation and public speaking skills",
+        "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 12,
+        "participants": ["ethan@mergington.edu"]
     }
-    
-    # Clear and restore original activities
-    activities.clear()
-    activities.update(original_activities)
-    
+}
+
+EXPECTED_ACTIVITIES = frozenset({
+    "Chess Club", "Programming Class", "Gym Class", "Basketball Team",
+    "Tennis Club", "Drama Club", "Art Studio", "Robotics Club", "Debate Team"
+})
+
+REQUIRED_FIELDS = frozenset({"description", "schedule", "max_participants", "participants"})
+
+# Request targets and query params reused across tests
+CHESS_SIGNUP_URL = "/activities/Chess Club/signup"
+CHESS_UNREGISTER_URL = "/activities/Chess Club/unregister"
+MISSING_SIGNUP_URL = "/activities/Non-Existent Activity/signup"
+MISSING_UNREGISTER_URL = "/activities/Non-Existent Activity/unregister"
+TENNIS_SIGNUP_URL = "/activities/Tennis Club/signup"
+ROBOTICS_SIGNUP_URL = "/activities/Robotics Club/signup"
+ROBOTICS_UNREGISTER_URL = "/activities/Robotics Club/unregister"
+DRAMA_SIGNUP_URL = "/activities/Drama Club/signup"
+DRAMA_UNREGISTER_URL = "/activities/Drama Club/unregister"
+
+NEW_STUDENT = "newstudent@mergington.edu"
+NEW_STUDENT_PARAMS = {"email": NEW_STUDENT}
+EXISTING_STUDENT = "michael@mergington.edu"
+EXISTING_STUDENT_PARAMS = {"email": EXISTING_STUDENT}
+TEST_USER = "testuser@mergington.edu"
+TEST_USER_PARAMS = {"email": TEST_USER}
+
+
+@pytest.fixture
+def reset_activities(request):
+    """Reset participants of the activities named by the test's touches marker
+
+    Unmarked tests get no reset, so any test that mutates state must be marked.
+    """
+    marker = request.node.get_closest_marker("touches")
+    names = marker.args if marker else ()
+
+    def restore():
+        for name in names:
+            _state[name]["participants"] = list(_ORIGINAL_ACTIVITIES[name]["participants"])
+
+    restore()
     yield
-    
-    # Reset again after test
-    activities.clear()
-    activities.update(original_activities)
+    restore()
+
+
+@pytest.fixture(scope="module")
+def activities_response(client):
+    """GET /activities once against the initial state and share the response"""
+    _state.clear()
+    _state.update(copy.deepcopy(_ORIGINAL_ACTIVITIES))
+    return client.get("/activities")
+
+
+@pytest.fixture(scope="module")
+def activities_snapshot(activities_response):
+    """Parsed body of the shared GET /activities response"""
+    return activities_response.json()
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_200(self, reset_activities):
+    def test_get_activities_returns_200(self, activities_response):
         """Test that GET /activities returns status 200"""
-        response = client.get("/activities")
-        assert response.status_code == 200
+        assert activities_response.status_code == 200
     
-    def test_get_activities_returns_dict(self, reset_activities):
+    def test_get_activities_returns_dict(self, activities_snapshot):
         """Test that GET /activities returns a dictionary"""
-        response = client.get("/activities")
-        assert isinstance(response.json(), dict)
+        assert isinstance(activities_snapshot, dict)
     
-    def test_get_activities_contains_all_activities(self, reset_activities):
+    def test_get_activities_contains_all_activities(self, activities_snapshot):
         """Test that GET /activities contains all expected activities"""
-        response = client.get("/activities")
-        activities_data = response.json()
-        
-        expected_activities = [
-            "Chess Club", "Programming Class", "Gym Class", "Basketball Team",
-            "Tennis Club", "Drama Club", "Art Studio", "Robotics Club", "Debate Team"
-        ]
-        
-        for activity in expected_activities:
-            assert activity in activities_data
+        assert EXPECTED_ACTIVITIES <= activities_snapshot.keys(), (
+            f"Missing activities: {sorted(EXPECTED_ACTIVITIES - activities_snapshot.keys())}"
+        )
     
-    def test_activity_has_required_fields(self, reset_activities):
+    # Sorted so every xdist worker collects the same node order
+    @pytest.mark.parametrize("activity", sorted(EXPECTED_ACTIVITIES))
+    def test_activity_has_required_fields(self, activities_snapshot, activity):
         """Test that each activity has required fields"""
-        response = client.get("/activities")
-        activities_data = response.json()
-        
-        required_fields = ["description", "schedule", "max_participants", "participants"]
-        
-        for activity_name, activity_data in activities_data.items():
-            for field in required_fields:
-                assert field in activity_data, f"Field '{field}' missing from {activity_name}"
+        activity_data = activities_snapshot[activity]
+        assert REQUIRED_FIELDS <= activity_data.keys(), (
+            f"Fields {sorted(REQUIRED_FIELDS - activity_data.keys())} missing from {activity}"
+        )
 
 
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_successful(self, reset_activities):
+    @pytest.mark.touches("Chess Club")
+    def test_signup_successful(self, client, reset_activities):
         """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": "newstudent@mergington.edu"}
-        )
+        response = client.post(CHESS_SIGNUP_URL, params=NEW_STUDENT_PARAMS)
         assert response.status_code == 200
-        assert "Signed up" in response.json()["message"]
-        assert "newstudent@mergington.edu" in response.json()["message"]
+        body = response.json()
+        assert body["message"] == SIGNUP_MSG.format(email=NEW_STUDENT, activity="Chess Club")
     
-    def test_signup_adds_participant(self, reset_activities):
+    @pytest.mark.touches("Chess Club")
+    def test_signup_adds_participant(self, client, reset_activities):
         """Test that signup actually adds the participant"""
-        email = "newstudent@mergington.edu"
-        client.post("/activities/Chess Club/signup", params={"email": email})
+        client.post(CHESS_SIGNUP_URL, params=NEW_STUDENT_PARAMS)
         
-        response = client.get("/activities")
-        activities_data = response.json()
-        assert email in activities_data["Chess Club"]["participants"]
+        assert NEW_STUDENT in _state["Chess Club"]["participants"]
     
-    def test_signup_activity_not_found(self, reset_activities):
+    def test_signup_activity_not_found(self, client):
         """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/Non-Existent Activity/signup",
-            params={"email": "student@mergington.edu"}
-        )
+        response = client.post(MISSING_SIGNUP_URL, params=NEW_STUDENT_PARAMS)
         assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
+        body = response.json()
+        assert body["detail"] == ACTIVITY_NOT_FOUND
     
-    def test_signup_already_registered(self, reset_activities):
+    @pytest.mark.touches("Chess Club")
+    def test_signup_already_registered(self, client, reset_activities):
         """Test signup when student is already registered"""
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": "michael@mergington.edu"}
-        )
+        response = client.post(CHESS_SIGNUP_URL, params=EXISTING_STUDENT_PARAMS)
         assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"]
+        body = response.json()
+        assert body["detail"] == ALREADY_SIGNED_UP
     
-    def test_multiple_signups(self, reset_activities):
+    @pytest.mark.touches("Tennis Club")
+    def test_multiple_signups(self, client, reset_activities):
         """Test multiple students can sign up for the same activity"""
-        student1 = "student1@mergington.edu"
-        student2 = "student2@mergington.edu"
+        student1_params = {"email": "student1@mergington.edu"}
+        student2_params = {"email": "student2@mergington.edu"}
         
-        response1 = client.post("/activities/Tennis Club/signup", params={"email": student1})
-        response2 = client.post("/activities/Tennis Club/signup", params={"email": student2})
+        response1 = client.post(TENNIS_SIGNUP_URL, params=student1_params)
+        response2 = client.post(TENNIS_SIGNUP_URL, params=student2_params)
         
         assert response1.status_code == 200
         assert response2.status_code == 200
@@ -181,78 +217,66 @@ class TestSignupForActivity:
 class TestUnregisterFromActivity:
     """Tests for POST /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_successful(self, reset_activities):
+    @pytest.mark.touches("Chess Club")
+    def test_unregister_successful(self, client, reset_activities):
         """Test successful unregistration from an activity"""
-        response = client.post(
-            "/activities/Chess Club/unregister",
-            params={"email": "michael@mergington.edu"}
-        )
+        response = client.post(CHESS_UNREGISTER_URL, params=EXISTING_STUDENT_PARAMS)
         assert response.status_code == 200
-        assert "Unregistered" in response.json()["message"]
+        body = response.json()
+        assert body["message"] == UNREGISTER_MSG.format(email=EXISTING_STUDENT, activity="Chess Club")
     
-    def test_unregister_removes_participant(self, reset_activities):
+    @pytest.mark.touches("Chess Club")
+    def test_unregister_removes_participant(self, client, reset_activities):
         """Test that unregister actually removes the participant"""
-        email = "michael@mergington.edu"
-        client.post("/activities/Chess Club/unregister", params={"email": email})
+        client.post(CHESS_UNREGISTER_URL, params=EXISTING_STUDENT_PARAMS)
         
-        response = client.get("/activities")
-        activities_data = response.json()
-        assert email not in activities_data["Chess Club"]["participants"]
+        assert EXISTING_STUDENT not in _state["Chess Club"]["participants"]
     
-    def test_unregister_activity_not_found(self, reset_activities):
+    def test_unregister_activity_not_found(self, client):
         """Test unregister from non-existent activity"""
-        response = client.post(
-            "/activities/Non-Existent Activity/unregister",
-            params={"email": "student@mergington.edu"}
-        )
+        response = client.post(MISSING_UNREGISTER_URL, params=NEW_STUDENT_PARAMS)
         assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
+        body = response.json()
+        assert body["detail"] == ACTIVITY_NOT_FOUND
     
-    def test_unregister_not_registered(self, reset_activities):
+    @pytest.mark.touches("Chess Club")
+    def test_unregister_not_registered(self, client, reset_activities):
         """Test unregister when student is not registered"""
-        response = client.post(
-            "/activities/Chess Club/unregister",
-            params={"email": "notstudent@mergington.edu"}
-        )
+        response = client.post(CHESS_UNREGISTER_URL, params=NEW_STUDENT_PARAMS)
         assert response.status_code == 400
-        assert "not signed up" in response.json()["detail"]
+        body = response.json()
+        assert body["detail"] == NOT_SIGNED_UP
 
 
 class TestSignupAndUnregisterFlow:
     """Integration tests for signup and unregister flows"""
     
-    def test_signup_then_unregister(self, reset_activities):
+    @pytest.mark.touches("Robotics Club")
+    def test_signup_then_unregister(self, client, reset_activities):
         """Test signup followed by unregister"""
-        email = "testuser@mergington.edu"
-        activity = "Robotics Club"
-        
         # Sign up
-        signup_response = client.post(f"/activities/{activity}/signup", params={"email": email})
+        signup_response = client.post(ROBOTICS_SIGNUP_URL, params=TEST_USER_PARAMS)
         assert signup_response.status_code == 200
         
         # Verify signup
-        get_response = client.get("/activities")
-        assert email in get_response.json()[activity]["participants"]
+        assert TEST_USER in _state["Robotics Club"]["participants"]
         
         # Unregister
-        unregister_response = client.post(f"/activities/{activity}/unregister", params={"email": email})
+        unregister_response = client.post(ROBOTICS_UNREGISTER_URL, params=TEST_USER_PARAMS)
         assert unregister_response.status_code == 200
         
         # Verify unregister
-        get_response = client.get("/activities")
-        assert email not in get_response.json()[activity]["participants"]
+        assert TEST_USER not in _state["Robotics Club"]["participants"]
     
-    def test_signup_again_after_unregister(self, reset_activities):
+    @pytest.mark.touches("Drama Club")
+    def test_signup_again_after_unregister(self, client, reset_activities):
         """Test can signup again after unregistering"""
-        email = "testuser@mergington.edu"
-        activity = "Drama Club"
-        
         # Sign up
-        client.post(f"/activities/{activity}/signup", params={"email": email})
+        client.post(DRAMA_SIGNUP_URL, params=TEST_USER_PARAMS)
         
         # Unregister
-        client.post(f"/activities/{activity}/unregister", params={"email": email})
+        client.post(DRAMA_UNREGISTER_URL, params=TEST_USER_PARAMS)
         
         # Sign up again
-        response = client.post(f"/activities/{activity}/signup", params={"email": email})
+        response = client.post(DRAMA_SIGNUP_URL, params=TEST_USER_PARAMS)
         assert response.status_code == 200